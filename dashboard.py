@@ -8,28 +8,560 @@ Usage: python dashboard.py [--port 8766] [--git-dir ~/git]
 
 import os
 import sys
+import asyncio
+import bisect
+import collections
 import json
 import subprocess
 import html
+import gzip
+import hashlib
+import re
+import shutil
+import socketserver
 import urllib.parse
+import urllib.request
+import uuid
+import queue
+import zlib
 from datetime import datetime, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 import argparse
+import configparser
+import contextlib
+import functools
 import threading
 import time
 
+def _porcelain_v1_entry(line):
+    """Render a porcelain v2 change entry in the short `XY path` form"""
+    kind, _, rest = line.partition(' ')
+    if kind in ('?', '!'):
+        return f'{kind}{kind} {rest}'
+    fields = rest.split(' ', {'1': 7, '2': 8, 'u': 9}.get(kind, 0))
+    xy = fields[0].replace('.', ' ')
+    path = fields[-1].split('\t')[0]
+    return f'{xy} {path}'
+
+def to_json(data):
+    """Serialize an API response compactly with the C-accelerated encoder"""
+    return json.dumps(data, separators=(',', ':'))
+
+# Repo operation routes: /api/repo/<name>/<operation> (matched with fullmatch)
+REPO_OP_RE = re.compile(r'/api/repo/([^/]+)/(fetch|pull)')
+
+def validate_repo_name(name):
+    """Check that a repo name from a URL can't escape the git directory
+    
+    Any name the scanner lists passes: a single, non-hidden path component
+    (which also rules out '.' and '..') with no separator or NUL in it.
+    """
+    separators = {'/', '\0', os.sep, os.altsep} - {None}
+    return bool(name) and not name.startswith('.') and not any(c in name for c in separators)
+
+# Uncommitted entries included in a repo's status preview
+PREVIEW_FILES = 5
+
+def parse_porcelain_v2(output):
+    """Parse raw `git status --porcelain=v2 --branch` bytes into status fields"""
+    info = {
+        'branch': 'unknown',
+        'upstream': None,
+        'ahead': 0,
+        'behind': 0
+    }
+    
+    # Header lines come first (at most five), so only the first few lines
+    # are split out; the rest is counted without building a list
+    lines = output.split(b'\n', PREVIEW_FILES + 5)[:PREVIEW_FILES + 5]
+    headers = 0
+    preview = []
+    for line in lines:
+        if line.startswith(b'# '):
+            headers += 1
+            key, _, value = line[2:].decode('utf-8', 'replace').partition(' ')
+            if key == 'branch.head':
+                info['branch'] = '' if value == '(detached)' else value
+            elif key == 'branch.upstream':
+                info['upstream'] = value
+            elif key == 'branch.ab':
+                ahead, behind = value.split()
+                info['ahead'] = int(ahead)
+                info['behind'] = -int(behind)
+        elif line and len(preview) < PREVIEW_FILES:
+            preview.append(_porcelain_v1_entry(line.decode('utf-8', 'replace')))
+    
+    count = output.count(b'\n') + (1 if output and not output.endswith(b'\n') else 0) - headers
+    info['uncommitted_count'] = count
+    info['has_uncommitted'] = count > 0
+    info['uncommitted_files'] = preview
+    return info
+
+# Upper bound on repos whose git processes run at the same time during a scan;
+# the work is mostly waiting on I/O, so allow several per core
+GIT_CONCURRENCY = min(32, (os.cpu_count() or 4) * 4)
+
+# Environment for read-only git probes, built once: optional locks off so
+# concurrent status calls never take index.lock, and C locale output
+GIT_READ_ENV = dict(os.environ, GIT_OPTIONAL_LOCKS='0', LC_ALL='C')
+
+# Environment for unattended fetches: fail instead of asking for credentials
+GIT_BATCH_ENV = dict(os.environ, GIT_TERMINAL_PROMPT='0')
+
+async def run_command(cmd, cwd=None, timeout=5, text=True, env=None, capture_stderr=True):
+    """Run a command on the event loop, mirroring subprocess.run
+    
+    Callers that never look at stderr can pass capture_stderr=False to skip
+    its pipe; `stderr` is then ''.
+    """
+    stderr_pipe = asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL
+    proc = await asyncio.create_subprocess_exec(*cmd, cwd=cwd, env=env, 
+                                                stdout=asyncio.subprocess.PIPE, 
+                                                stderr=stderr_pipe)
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if text:
+        stdout = stdout.decode('utf-8', 'replace')
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, 
+                                       stderr.decode('utf-8', 'replace') if stderr else '')
+
+# (upper bound in seconds, seconds per unit, unit name) for relative commit times
+RELATIVE_TIME_UNITS = (
+    (60, 1, 'second'),
+    (3600, 60, 'minute'),
+    (86400, 3600, 'hour'),
+    (604800, 86400, 'day'),
+    (2629746, 604800, 'week'),
+    (31556952, 2629746, 'month'),
+    (float('inf'), 31556952, 'year'),
+)
+
+_RELATIVE_TIME_LIMITS = [limit for limit, _, _ in RELATIVE_TIME_UNITS]
+
+def relative_time(timestamp, now):
+    """Format an epoch timestamp like git's relative dates ("3 hours ago")"""
+    delta = max(0, int(now) - timestamp)
+    _, unit, name = RELATIVE_TIME_UNITS[bisect.bisect_right(_RELATIVE_TIME_LIMITS, delta)]
+    count = delta // unit
+    return f"{count} {name}{'' if count == 1 else 's'} ago"
+
+def format_commit_times(statuses, now=None):
+    """Fill in each last commit's relative time against a single `now`"""
+    if now is None:
+        now = time.time()
+    for status in statuses:
+        commit = status.get('last_commit')
+        if commit:
+            status['last_commit'] = dict(commit, time=relative_time(commit['timestamp'], now))
+
+def env_int(name, default, minimum=0):
+    """Read an integer setting from the environment, keeping the default
+    (with a warning) when the value isn't a usable number"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        print(f"Warning: ignoring {name}={value!r}, using {default}")
+        return default
+    return number
+
+# Directory scanned for repositories unless --git-dir says otherwise
+GIT_ROOT = Path.home() / 'git'
+
+# Seconds between background rescans of the git directory
+REFRESH_INTERVAL = 30
+
+# Seconds between background fetches of repos with an upstream (0 disables),
+# and how many fetches or pulls may hit the network at once (remotes such as
+# GitHub throttle bursts; main() applies DASHBOARD_FETCH_CONCURRENCY). Local
+# git commands are limited separately by GIT_CONCURRENCY.
+FETCH_INTERVAL = 60
+FETCH_CONCURRENCY = 4
+
+# Seconds between checks of each repo's stat() fingerprint, so commits,
+# staging and checkouts show up without waiting for the next full scan
+WATCH_INTERVAL = 2
+
+# Worker threads for queued fetches and pulls (enough to fill every network
+# slot), and how many finished jobs to remember
+JOB_WORKERS = FETCH_CONCURRENCY
+JOBS_KEPT = 100
+
+# Seconds between keepalive comments on an idle /api/events stream
+EVENTS_KEEPALIVE = 15
+
+# Seconds an idle keep-alive connection may hold on to its handler thread
+CONNECTION_TIMEOUT = 60
+
+# Reuse a repo's status while HEAD, the index, the work tree's top directory,
+# the upstream ref and FETCH_HEAD are unchanged. The TTL bounds how long
+# edits further down the work tree can go unnoticed; it spans two background
+# scans so unchanged repos skip `git status` on every other one.
+STATUS_CACHE_TTL = 60
+
+_status_cache = {}
+_status_cache_lock = threading.Lock()
+
+# Open issue counts change on human timescales; refresh them every 10 minutes
+# unless DASHBOARD_ISSUE_TTL says otherwise (GitHub rate-limits API calls)
+ISSUE_COUNT_TTL = env_int('DASHBOARD_ISSUE_TTL', 600)
+
+_issue_counts = {}
+_issue_counts_lock = threading.Lock()
+
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# Looked up once; without gh or a token there is nothing to ask for counts
+GH_PATH = shutil.which('gh')
+
+GITHUB_REMOTE_RE = re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$')
+
+def github_url_from_remote(remote_url):
+    """Map an origin remote URL to its https://github.com page, if any"""
+    match = GITHUB_REMOTE_RE.search(remote_url.strip())
+    if not match:
+        return None
+    return f'https://github.com/{match.group(1)}/{match.group(2)}'
+
+def resolve_git_dir(repo_path):
+    """Find a repo's git directory without running git, or None if it has none
+    
+    `.git` is usually a directory, but worktrees and submodules use a file
+    holding a `gitdir: <path>` pointer instead.
+    """
+    git_dir = Path(repo_path) / '.git'
+    if git_dir.is_file():
+        try:
+            pointer = git_dir.read_text().strip()
+        except OSError:
+            return None
+        if not pointer.startswith('gitdir: '):
+            return None
+        git_dir = Path(repo_path) / pointer[len('gitdir: '):]
+    if not (git_dir / 'HEAD').is_file():
+        return None
+    return git_dir
+
+def is_bare_repo(path):
+    """Whether a directory is laid out as a bare repository
+    
+    Bare repos have no work tree for `git status` to look at, so they are
+    recognised from their layout without running git.
+    """
+    path = Path(path)
+    return (path / 'HEAD').is_file() and (path / 'objects').is_dir() and (path / 'refs').is_dir()
+
+def _common_git_dir(git_dir):
+    """Git directory holding shared refs and config (differs for worktrees)"""
+    commondir = git_dir / 'commondir'
+    if commondir.exists():
+        return git_dir / commondir.read_text().strip()
+    return git_dir
+
+def _read_origin_url(repo_path):
+    """Read remote.origin.url from the repo's config without spawning git
+    
+    Returns '' when there is no origin remote and None when the config
+    can't be read.
+    """
+    git_dir = resolve_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    config = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        if not config.read(_common_git_dir(git_dir) / 'config'):
+            return None
+    except (OSError, configparser.Error):
+        return None
+    return config.get('remote "origin"', 'url', fallback='')
+
+@functools.lru_cache(maxsize=256)
+def origin_github_url(repo_path):
+    """GitHub page for a repo's origin remote (remotes rarely change)"""
+    remote_url = _read_origin_url(repo_path)
+    if remote_url is None:
+        # Configs configparser can't parse
+        result = subprocess.run(['git', '-C', repo_path, 'config', '--get', 'remote.origin.url'], 
+                             capture_output=True, text=True, timeout=5, env=GIT_READ_ENV)
+        if result.returncode != 0:
+            return None
+        remote_url = result.stdout
+    return github_url_from_remote(remote_url)
+
+def _read_head_sha(git_dir):
+    """Resolve HEAD to a commit sha by reading loose or packed refs"""
+    head = (git_dir / 'HEAD').read_text().strip()
+    if not head.startswith('ref: '):
+        return head
+    ref = head[len('ref: '):]
+    git_dir = _common_git_dir(git_dir)
+    ref_path = git_dir / ref
+    if ref_path.exists():
+        return ref_path.read_text().strip()
+    packed_refs = git_dir / 'packed-refs'
+    if packed_refs.exists():
+        for line in packed_refs.read_text().splitlines():
+            if line.endswith(' ' + ref):
+                return line.split(' ', 1)[0]
+    return ''
+
+@functools.lru_cache(maxsize=256)
+def _upstream_ref(config_path, mtime_ns, branch):
+    """Ref a branch tracks according to its config, or None
+    
+    `mtime_ns` only takes part in the cache key, so an edited config is read
+    again. Assumes the default fetch refspec, as nearly every remote has.
+    """
+    config = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        config.read(config_path)
+    except configparser.Error:
+        return None
+    section = f'branch "{branch}"'
+    remote = config.get(section, 'remote', fallback='')
+    merge = config.get(section, 'merge', fallback='')
+    if not remote or not merge.startswith('refs/heads/'):
+        return None
+    if remote == '.':
+        return merge
+    return f'refs/remotes/{remote}/{merge[len("refs/heads/"):]}'
+
+# The last parts of a status cache key (packed-refs, the upstream ref and
+# FETCH_HEAD) only move when remote-tracking refs do, after a fetch or push
+_TRACKING_KEY_PARTS = 3
+
+def _same_but_tracking(key, other):
+    """Whether two status cache keys differ at most in their tracking parts"""
+    return key[:-_TRACKING_KEY_PARTS] == other[:-_TRACKING_KEY_PARTS]
+
+def _status_cache_key(repo_path):
+    """Cheap fingerprint of a repo's state, or None if it can't be taken"""
+    git_dir = resolve_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / 'HEAD').read_text()
+        common_dir = _common_git_dir(git_dir)
+        upstream = None
+        if head.startswith('ref: refs/heads/'):
+            config = common_dir / 'config'
+            upstream = _upstream_ref(str(config), config.stat().st_mtime_ns, 
+                                     head.strip()[len('ref: refs/heads/'):])
+        mtimes = []
+        # A push moves only the upstream ref, so it is watched like FETCH_HEAD
+        for path in (git_dir / 'index', Path(repo_path), common_dir / 'packed-refs', 
+                     common_dir / upstream if upstream else None, git_dir / 'FETCH_HEAD'):
+            try:
+                mtimes.append(path.stat().st_mtime_ns if path else 0)
+            except FileNotFoundError:
+                mtimes.append(0)
+        return (head, _read_head_sha(git_dir), *mtimes)
+    except OSError:
+        return None
+
+def read_loose_commit(git_dir, sha):
+    """Read HEAD-style commit info straight from a loose object, or None
+    
+    New commits start out as loose objects, so this usually covers a HEAD
+    that just moved. Packed objects are left to `git log`.
+    """
+    if len(sha) != 40:
+        return None
+    try:
+        raw = zlib.decompress((_common_git_dir(git_dir) / 'objects' / sha[:2] / sha[2:]).read_bytes())
+    except (OSError, zlib.error):
+        return None
+    header, _, body = raw.partition(b'\0')
+    if not header.startswith(b'commit '):
+        return None
+    headers, _, message = body.decode('utf-8', 'replace').partition('\n\n')
+    author = authored = None
+    for line in headers.split('\n'):
+        if line.startswith('author '):
+            # "author Name <email> <unix time> <tz>", matching %an and %at
+            author = line[len('author '):].rpartition(' <')[0]
+            authored = line.rsplit(' ', 2)[1]
+            break
+    if author is None:
+        return None
+    # Like %s: the first paragraph of the message, joined onto one line
+    subject = []
+    for line in message.split('\n'):
+        if line.strip():
+            subject.append(line.rstrip())
+        elif subject:
+            break
+    return {
+        'hash': sha[:8],
+        'message': ' '.join(subject),
+        'author': author,
+        'timestamp': int(authored)
+    }
+
+# `%(upstream:track)` output, e.g. "[ahead 2, behind 1]" or "[gone]"
+UPSTREAM_TRACK_RE = re.compile(r'(ahead|behind) (\d+)')
+
+async def refresh_tracking(repo_path):
+    """Update only upstream/ahead/behind of a cached status after a fetch
+    
+    A fetch leaves HEAD and the working tree alone, so one for-each-ref
+    call is enough. Returns None if there is no usable cached status.
+    """
+    repo_path = Path(repo_path)
+    key = _status_cache_key(repo_path)
+    with _status_cache_lock:
+        cached = _status_cache.get(repo_path)
+    # Only the tracking refs may differ from when the status was cached
+    if key is None or cached is None or not _same_but_tracking(cached[0], key) or not cached[2].get('branch'):
+        return None
+    
+    result = await run_command(['git', 'for-each-ref', '--format=%(upstream:short)%1f%(upstream:track)', 
+                                'refs/heads/' + cached[2]['branch']], cwd=repo_path, env=GIT_READ_ENV, 
+                               capture_stderr=False)
+    if result.returncode != 0 or not result.stdout:
+        return None
+    upstream, _, track = result.stdout.rstrip('\n').partition('\x1f')
+    counts = dict(UPSTREAM_TRACK_RE.findall(track))
+    status = dict(cached[2], upstream=upstream or None,
+                  ahead=int(counts.get('ahead', 0)), behind=int(counts.get('behind', 0)))
+    # Keep the original timestamp: the working tree wasn't looked at again
+    with _status_cache_lock:
+        _status_cache[repo_path] = (key, cached[1], dict(status))
+    return status
+
+def invalidate_status(repo_path):
+    """Drop a repo's cached status after it was changed"""
+    with _status_cache_lock:
+        _status_cache.pop(Path(repo_path), None)
+
+def _github_slug(github_url):
+    return github_url[len('https://github.com/'):]
+
+def _query_open_issues(slugs):
+    """Fetch open issue counts for many repos with one GraphQL query"""
+    fields = []
+    for i, slug in enumerate(slugs):
+        owner, name = slug.split('/', 1)
+        fields.append(f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) '
+                      '{ issues(states: OPEN) { totalCount } }')
+    query = 'query { ' + ' '.join(fields) + ' }'
+    
+    token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+    if not token and GH_PATH is None:
+        return {}
+    try:
+        if token:
+            # Talk to the API directly rather than starting gh for it
+            request = urllib.request.Request(GITHUB_GRAPHQL_URL, data=to_json({'query': query}).encode('utf-8'), 
+                                             headers={'Authorization': f'Bearer {token}', 
+                                                      'Content-Type': 'application/json'})
+            with urllib.request.urlopen(request, timeout=15) as response:
+                output = response.read()
+        else:
+            output = subprocess.run([GH_PATH, 'api', 'graphql', '-f', f'query={query}'], 
+                                 capture_output=True, text=True, timeout=15).stdout
+        # Missing or private repos fail individually; the rest still come back as data
+        data = json.loads(output).get('data') or {}
+    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, OSError):
+        return {}
+    
+    counts = {}
+    for i, slug in enumerate(slugs):
+        repo = data.get(f'r{i}')
+        if repo:
+            counts[slug] = repo['issues']['totalCount']
+    return counts
+
+def attach_open_issues(statuses):
+    """Add open issue counts to repo statuses, querying only stale entries"""
+    by_slug = {}
+    for status in statuses:
+        url = status.get('github_url')
+        if url:
+            by_slug.setdefault(_github_slug(url), []).append(status)
+    if not by_slug:
+        return
+    
+    now = time.monotonic()
+    with _issue_counts_lock:
+        stale = [slug for slug in by_slug 
+                 if slug not in _issue_counts or now - _issue_counts[slug][0] >= ISSUE_COUNT_TTL]
+    if stale:
+        counts = _query_open_issues(stale)
+        with _issue_counts_lock:
+            for slug in stale:
+                # Repos the query failed for (no gh, private, offline) keep their
+                # last count, or None, until the TTL is up instead of being
+                # queried again on every scan
+                previous = _issue_counts.get(slug, (None, None))[1]
+                _issue_counts[slug] = (now, counts.get(slug, previous))
+    
+    with _issue_counts_lock:
+        cached = {slug: _issue_counts[slug][1] for slug in by_slug if slug in _issue_counts}
+    for slug, count in cached.items():
+        if count is None:
+            continue
+        for status in by_slug[slug]:
+            status['open_issues'] = count
+
+def invalidate_open_issues(github_url):
+    """Forget a repo's cached issue count so the next lookup refreshes it"""
+    with _issue_counts_lock:
+        _issue_counts.pop(_github_slug(github_url), None)
+
 class RepoInfo:
-    def __init__(self, path):
+    def __init__(self, path, collect=True):
         self.path = Path(path)
         self.name = self.path.name
-        self.status = self._get_status()
+        self.status = asyncio.run(self._get_cached_status()) if collect else None
+    
+    @classmethod
+    async def load(cls, path):
+        """Build a RepoInfo from inside a running event loop"""
+        repo = cls(path, collect=False)
+        repo.status = await repo._get_cached_status()
+        return repo
+    
+    async def _get_cached_status(self):
+        """Get repo status, reusing a recent result if the repo is unchanged"""
+        key = _status_cache_key(self.path)
+        now = time.monotonic()
+        last_commit = None
+        if key is not None:
+            with _status_cache_lock:
+                cached = _status_cache.get(self.path)
+            if cached and cached[0] == key and now - cached[1] < STATUS_CACHE_TTL:
+                return dict(cached[2])
+            if cached and key[1] and cached[0][1] == key[1]:
+                # Same HEAD commit, so its details haven't changed
+                last_commit = cached[2].get('last_commit')
+        
+        status = await self._get_status(last_commit)
+        if key is not None and 'error' not in status:
+            with _status_cache_lock:
+                _status_cache[self.path] = (key, now, dict(status))
+        return status
         
-    def _get_status(self):
-        """Get comprehensive repo status"""
-        if not (self.path / '.git').exists():
+    async def _get_status(self, last_commit=None):
+        """Get comprehensive repo status
+        
+        `last_commit` is the already known info for the current HEAD commit,
+        which saves the `git log` call.
+        """
+        git_dir = resolve_git_dir(self.path)
+        if git_dir is None:
             return {
-                'error': 'Not a git repository',
+                'name': self.name,
+                'error': 'Bare repository (no working tree)' if is_bare_repo(self.path) else 'Not a git repository',
                 'is_repo': False
             }
             
@@ -40,76 +572,20 @@ class RepoInfo:
         }
         
         try:
-            os.chdir(self.path)
-            
-            # Current branch
-            result = subprocess.run(['git', 'branch', '--show-current'], 
-                                 capture_output=True, text=True, timeout=5)
-            status['branch'] = result.stdout.strip() if result.returncode == 0 else 'unknown'
-            
-            # Uncommitted changes
-            result = subprocess.run(['git', 'status', '--porcelain'], 
-                                 capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                changes = result.stdout.strip().split('\n') if result.stdout.strip() else []
-                status['uncommitted_count'] = len(changes)
-                status['has_uncommitted'] = len(changes) > 0
-                status['uncommitted_files'] = changes[:5]  # First 5 for preview
-            else:
-                status['uncommitted_count'] = 0
-                status['has_uncommitted'] = False
-                status['uncommitted_files'] = []
+            # The probes are independent, so run them side by side; open issue
+            # counts are attached later in one batch
+            loop = asyncio.get_running_loop()
+            probes = [self._get_changes(), 
+                      loop.run_in_executor(None, origin_github_url, str(self.path))]
+            # Last commit, unless HEAD hasn't moved since it was last read
+            if last_commit is None:
+                probes.append(self._get_last_commit())
+            changes, github_url, *commit = await asyncio.gather(*probes)
             
-            # Remote tracking
-            result = subprocess.run(['git', 'rev-parse', '--abbrev-ref', '@{upstream}'], 
-                                 capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                upstream = result.stdout.strip()
-                status['upstream'] = upstream
-                
-                # Fetch to get latest remote info (this is safe)
-                subprocess.run(['git', 'fetch', '--dry-run'], 
-                             capture_output=True, timeout=10)
-                
-                # Ahead/behind
-                result = subprocess.run(['git', 'rev-list', '--left-right', '--count', f'HEAD...{upstream}'], 
-                                     capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    counts = result.stdout.strip().split('\t')
-                    status['ahead'] = int(counts[0]) if len(counts) > 0 else 0
-                    status['behind'] = int(counts[1]) if len(counts) > 1 else 0
-                else:
-                    status['ahead'] = 0
-                    status['behind'] = 0
-            else:
-                status['upstream'] = None
-                status['ahead'] = 0
-                status['behind'] = 0
-            
-            # Last commit
-            result = subprocess.run(['git', 'log', '-1', '--format=%H|%s|%an|%ar'], 
-                                 capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split('|')
-                status['last_commit'] = {
-                    'hash': parts[0][:8] if len(parts) > 0 else '',
-                    'message': parts[1] if len(parts) > 1 else '',
-                    'author': parts[2] if len(parts) > 2 else '',
-                    'time': parts[3] if len(parts) > 3 else ''
-                }
-            else:
-                status['last_commit'] = None
-                
-            # GitHub info (if gh CLI is available)
-            try:
-                result = subprocess.run(['gh', 'repo', 'view', '--json', 'url,openIssues'], 
-                                     capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    gh_info = json.loads(result.stdout)
-                    status['github_url'] = gh_info.get('url', '')
-                    status['open_issues'] = gh_info.get('openIssues', {}).get('totalCount', 0)
-            except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
-                pass
+            status.update(changes)
+            status['last_commit'] = commit[0] if commit else last_commit
+            if github_url:
+                status['github_url'] = github_url
                 
         except subprocess.TimeoutExpired:
             status['error'] = 'Git command timed out'
@@ -117,176 +593,195 @@ class RepoInfo:
             status['error'] = str(e)
             
         return status
+    
+    async def _get_changes(self):
+        """Branch, upstream, ahead/behind and working tree changes"""
+        # All of it comes from one call
+        result = await run_command(['git', '-c', 'core.quotepath=off', 'status', '--porcelain=v2', '--branch'], 
+                                   cwd=self.path, text=False, env=GIT_READ_ENV)
+        if result.returncode != 0:
+            changes = parse_porcelain_v2(b'')
+            changes['error'] = result.stderr.strip() or 'git status failed'
+            return changes
+        return parse_porcelain_v2(result.stdout)
+    
+    async def _get_last_commit(self):
+        """Hash, subject, author and author time of HEAD, or None"""
+        git_dir = resolve_git_dir(self.path)
+        if git_dir is not None:
+            commit = read_loose_commit(git_dir, _read_head_sha(git_dir))
+            if commit is not None:
+                return commit
+        
+        # Fields are separated by ASCII unit separators, which can't occur in
+        # subjects or names (unlike "|")
+        result = await run_command(['git', 'log', '-1', '--format=%H%x1f%s%x1f%an%x1f%at'], 
+                                   cwd=self.path, env=GIT_READ_ENV, capture_stderr=False)
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        try:
+            commit_hash, message, author, timestamp = result.stdout.rstrip('\n').split('\x1f', 3)
+            return {
+                'hash': commit_hash[:8],
+                'message': message,
+                'author': author,
+                'timestamp': int(timestamp)
+            }
+        except ValueError:
+            return None
 
-class DashboardHandler(BaseHTTPRequestHandler):
-    def __init__(self, git_dir, *args, **kwargs):
+async def scan_repos(paths):
+    """Collect the status of many repos concurrently"""
+    semaphore = asyncio.Semaphore(GIT_CONCURRENCY)
+    
+    async def load(path):
+        async with semaphore:
+            try:
+                repo = await RepoInfo.load(path)
+                return repo.status
+            except Exception as e:
+                return {
+                    'name': path.name,
+                    'error': str(e),
+                    'is_repo': False
+                }
+    
+    return await asyncio.gather(*(load(path) for path in paths))
+
+class RepoScanner:
+    """Keeps a snapshot of every repo's status fresh in a background thread"""
+    
+    def __init__(self, git_dir, interval=REFRESH_INTERVAL):
         self.git_dir = Path(git_dir)
-        super().__init__(*args, **kwargs)
+        self.interval = interval
+        self._lock = threading.RLock()
+        self._snapshot = None
+        self._version = 0
+        self._changed = threading.Condition(self._lock)
+        self._ready = threading.Event()
+        self._running = False
+        self._json = (None, None, None)
     
-    def do_GET(self):
-        """Handle GET requests"""
-        if self.path == '/':
-            self._send_dashboard()
-        elif self.path == '/api/repos':
-            self._send_repos_json()
-        elif self.path.startswith('/api/repo/') and self.path.endswith('/fetch'):
-            # Safe operation - can be GET
-            repo_name = self.path.split('/')[3]
-            self._handle_fetch(repo_name)
-        else:
-            self._send_404()
+    def start(self):
+        """Start refreshing the snapshot every `interval` seconds"""
+        self._running = True
+        threading.Thread(target=self._run, daemon=True).start()
     
-    def do_POST(self):
-        """Handle POST requests"""
-        if self.path.startswith('/api/repo/') and '/pull' in self.path:
-            repo_name = self.path.split('/')[3]
-            
-            # Read POST body for confirmation
-            content_length = int(self.headers.get('Content-Length', 0))
-            if content_length:
-                post_data = self.rfile.read(content_length).decode('utf-8')
-                try:
-                    data = json.loads(post_data)
-                    confirmed = data.get('confirmed', False)
-                except json.JSONDecodeError:
-                    confirmed = False
-            else:
-                confirmed = False
-            
-            self._handle_pull(repo_name, confirmed)
-        else:
-            self._send_404()
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f'Background scan failed: {e}')
+                if not self._ready.is_set():
+                    # Don't leave requests waiting for a first scan that never comes
+                    self._publish({'error': f'Scan failed: {e}', 'repos': []})
+            time.sleep(self.interval)
     
-    def _send_dashboard(self):
-        """Send the main dashboard HTML"""
-        html_content = self._generate_html()
-        self._send_response(200, html_content, 'text/html')
+    def snapshot(self):
+        """Latest scan result, waiting for the first scan if none has finished yet"""
+        if not self._running and not self._ready.is_set():
+            self.refresh()
+        # Requests arriving during the first background scan share its result
+        # instead of each starting a scan of their own
+        self._ready.wait()
+        with self._lock:
+            return self._snapshot
     
-    def _send_repos_json(self):
-        """Send repository information as JSON"""
-        repos_data = self._get_repos_data()
-        self._send_response(200, json.dumps(repos_data, indent=2), 'application/json')
+    def refresh(self):
+        """Rescan all repos and swap in the new snapshot"""
+        data = self.scan()
+        if not self._ready.is_set():
+            # Show the first page as soon as git is done; issue counts can
+            # take a GitHub round-trip and follow in the next publish
+            self._publish(data)
+            data = dict(data, repos=[dict(repo) for repo in data['repos']])
+        attach_open_issues(data['repos'])
+        self._publish(data)
+        return data
     
-    def _handle_fetch(self, repo_name):
-        """Handle git fetch operation"""
-        repo_path = self.git_dir / repo_name
-        if not repo_path.exists():
-            self._send_error_json(404, f"Repository {repo_name} not found")
-            return
-            
-        try:
-            os.chdir(repo_path)
-            result = subprocess.run(['git', 'fetch'], 
-                                 capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                # Get updated status
-                repo = RepoInfo(repo_path)
-                response = {
-                    'success': True,
-                    'message': 'Fetch completed successfully',
-                    'output': result.stdout + result.stderr,
-                    'repo_status': repo.status
-                }
-            else:
-                response = {
-                    'success': False,
-                    'message': 'Fetch failed',
-                    'output': result.stdout + result.stderr
-                }
-                
-        except subprocess.TimeoutExpired:
-            response = {
-                'success': False,
-                'message': 'Fetch timed out'
-            }
-        except Exception as e:
-            response = {
-                'success': False,
-                'message': f'Error during fetch: {str(e)}'
-            }
+    def _publish(self, data):
+        with self._lock:
+            self._set_snapshot(data)
+        self._ready.set()
+    
+    def _set_snapshot(self, data):
+        self._snapshot = data
+        self._version += 1
+        self._changed.notify_all()
+    
+    def wait_for_change(self, version, timeout=None):
+        """Wait until the snapshot is newer than `version`
         
-        self._send_response(200, json.dumps(response), 'application/json')
+        Returns the current (version, snapshot), which is unchanged if the
+        timeout expired first.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._version > version, timeout)
+            return self._version, self._snapshot
     
-    def _handle_pull(self, repo_name, confirmed=False):
-        """Handle git pull operation with safety checks"""
-        repo_path = self.git_dir / repo_name
-        if not repo_path.exists():
-            self._send_error_json(404, f"Repository {repo_name} not found")
-            return
+    def snapshot_json(self):
+        """Latest snapshot as (JSON bytes, gzipped JSON, weak ETag)
         
-        try:
-            os.chdir(repo_path)
-            repo = RepoInfo(repo_path)
-            
-            # Safety check: uncommitted changes
-            if not confirmed and repo.status.get('has_uncommitted', False):
-                response = {
-                    'success': False,
-                    'need_confirmation': True,
-                    'message': f'Repository has {repo.status["uncommitted_count"]} uncommitted changes',
-                    'details': {
-                        'branch': repo.status.get('branch', 'unknown'),
-                        'uncommitted_count': repo.status.get('uncommitted_count', 0),
-                        'ahead': repo.status.get('ahead', 0),
-                        'behind': repo.status.get('behind', 0)
-                    },
-                    'warning': 'Pull may fail or create merge conflicts. Confirm to continue.'
-                }
-                self._send_response(200, json.dumps(response), 'application/json')
+        Serialized once per snapshot version rather than once per request.
+        The ETag ignores scan_time, so a rescan that changed nothing still
+        matches what clients already have.
+        """
+        return self.serialized_snapshot()[1]
+    
+    def serialized_snapshot(self):
+        """Latest snapshot together with its snapshot_json() serialization"""
+        self.snapshot()
+        with self._lock:
+            version, data, cached = self._json
+            if version != self._version:
+                data = self._snapshot
+                body = to_json(data).encode('utf-8')
+                digest = hashlib.blake2b(to_json(dict(data, scan_time=None)).encode('utf-8'), 
+                                         digest_size=16).hexdigest()
+                cached = (body, gzip.compress(body), f'W/"{digest}"')
+                self._json = (self._version, data, cached)
+            return data, cached
+    
+    def update_repo(self, status):
+        """Replace one repo's entry after an out-of-band status update"""
+        with self._lock:
+            if self._snapshot is None:
                 return
-            
-            # Perform the pull
-            result = subprocess.run(['git', 'pull'], 
-                                 capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                # Get updated status
-                updated_repo = RepoInfo(repo_path)
-                response = {
-                    'success': True,
-                    'message': 'Pull completed successfully',
-                    'output': result.stdout + result.stderr,
-                    'repo_status': updated_repo.status
-                }
-            else:
-                response = {
-                    'success': False,
-                    'message': 'Pull failed',
-                    'output': result.stdout + result.stderr
-                }
-                
-        except subprocess.TimeoutExpired:
-            response = {
-                'success': False,
-                'message': 'Pull timed out'
-            }
-        except Exception as e:
-            response = {
-                'success': False,
-                'message': f'Error during pull: {str(e)}'
-            }
-        
-        self._send_response(200, json.dumps(response), 'application/json')
+            repos = [status if repo.get('name') == status.get('name') else repo 
+                     for repo in self._snapshot['repos']]
+            self._set_snapshot(dict(self._snapshot, repos=repos))
     
-    def _get_repos_data(self):
-        """Scan git directory and get repository information"""
-        repos = []
+    def rescan_repo(self, repo_path, after_fetch=False):
+        """Refresh one repo's snapshot entry and return its status
         
+        After a fetch only the tracking info can have changed, which is much
+        cheaper to re-read than the full status.
+        """
+        status = asyncio.run(refresh_tracking(repo_path)) if after_fetch else None
+        if status is None:
+            invalidate_status(repo_path)
+            status = RepoInfo(repo_path).status
+        attach_open_issues([status])
+        format_commit_times([status])
+        self.update_repo(status)
+        return status
+    
+    def scan(self):
+        """Scan git directory and get repository information, without issue counts"""
         if not self.git_dir.exists():
             return {'error': f'Git directory {self.git_dir} does not exist', 'repos': []}
         
-        for item in sorted(self.git_dir.iterdir()):
-            if item.is_dir() and not item.name.startswith('.'):
-                try:
-                    repo = RepoInfo(item)
-                    repos.append(repo.status)
-                except Exception as e:
-                    repos.append({
-                        'name': item.name,
-                        'error': str(e),
-                        'is_repo': False
-                    })
+        now = time.time()
+        # DirEntry.is_dir() answers from the directory listing itself, so only
+        # symlinked entries cost an extra stat
+        with os.scandir(self.git_dir) as entries:
+            names = sorted(entry.name for entry in entries 
+                           if not entry.name.startswith('.') and entry.is_dir())
+        # Sorting plain names avoids Path's slower comparisons
+        items = [self.git_dir / name for name in names]
+        repos = asyncio.run(scan_repos(items))
+        format_commit_times(repos, now)
         
         return {
             'scan_time': datetime.now(timezone.utc).isoformat(),
@@ -294,16 +789,264 @@ class DashboardHandler(BaseHTTPRequestHandler):
             'total_repos': len([r for r in repos if r.get('is_repo', False)]),
             'repos': repos
         }
+
+# Every fetch and pull, from the page or the background fetcher, takes one of
+# FETCH_CONCURRENCY network slots, and two never run in the same repo at once
+_git_op_slots = threading.BoundedSemaphore(FETCH_CONCURRENCY)
+_repo_locks = collections.defaultdict(threading.Lock)
+_repo_locks_lock = threading.Lock()
+
+def set_fetch_concurrency(slots):
+    """Resize the network slots; call before any fetch or pull starts"""
+    global _git_op_slots
+    _git_op_slots = threading.BoundedSemaphore(slots)
+
+@contextlib.contextmanager
+def repo_operation(repo_path):
+    """Hold the repo's own lock, then a network slot, for a fetch or pull"""
+    with _repo_locks_lock:
+        lock = _repo_locks[str(repo_path)]
+    with lock, _git_op_slots:
+        yield
+
+async def fetch_repos(paths):
+    """Run `git fetch` in many repos, returning the ones that succeeded"""
+    def fetch(path):
+        try:
+            # Only the branch refs matter for ahead/behind; tags and
+            # submodules wait for the user's own fetch. Nobody is there to
+            # answer a prompt, so there's no stdin and, in a new session, no
+            # terminal for git or ssh to ask on either.
+            with repo_operation(path):
+                result = subprocess.run(['git', 'fetch', '--quiet', '--no-tags', '--recurse-submodules=no'], 
+                                        cwd=path, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, 
+                                        stderr=subprocess.DEVNULL, env=GIT_BATCH_ENV, 
+                                        start_new_session=True, timeout=30)
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, OSError):
+            return False
     
-    def _generate_html(self):
-        """Generate the dashboard HTML"""
-        return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Project Status Dashboard v2</title>
-    <style>
+    # Blocking on repo_operation's locks, so each fetch runs on a worker thread
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(loop.run_in_executor(None, fetch, path) for path in paths))
+    return [path for path, ok in zip(paths, results) if ok]
+
+class RepoFetcher:
+    """Fetches repos with an upstream in the background, off the request path"""
+    
+    def __init__(self, scanner, interval=FETCH_INTERVAL):
+        self.scanner = scanner
+        self.interval = interval
+    
+    def start(self):
+        """Start fetching every `interval` seconds"""
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.fetch_all()
+            except Exception as e:
+                print(f'Background fetch failed: {e}')
+    
+    def fetch_all(self):
+        """Fetch every repo that tracks an upstream and update its status"""
+        paths = [Path(repo['path']) for repo in self.scanner.snapshot()['repos'] 
+                 if repo.get('upstream') and not self._fetched_recently(repo['path'])]
+        for path in asyncio.run(fetch_repos(paths)):
+            self.scanner.rescan_repo(path, after_fetch=True)
+    
+    def _fetched_recently(self, repo_path):
+        """Whether FETCH_HEAD shows a fetch (ours or the user's) within the interval"""
+        git_dir = resolve_git_dir(repo_path)
+        if git_dir is None:
+            return False
+        try:
+            return time.time() - (git_dir / 'FETCH_HEAD').stat().st_mtime < self.interval
+        except OSError:
+            return False
+
+class RepoWatcher:
+    """Rescans single repos as soon as their git state changes on disk
+    
+    The stdlib has no portable file watching, so this polls the same cheap
+    fingerprint the status cache is keyed on: a few stat() calls per repo.
+    """
+    
+    def __init__(self, scanner, interval=WATCH_INTERVAL):
+        self.scanner = scanner
+        self.interval = interval
+    
+    def start(self):
+        """Start checking every `interval` seconds"""
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.check()
+            except Exception as e:
+                print(f'Repo watch failed: {e}')
+    
+    def check(self):
+        """Rescan every repo whose fingerprint moved since its status was taken"""
+        for repo in self.scanner.snapshot()['repos']:
+            if 'path' not in repo:
+                continue
+            path = Path(repo['path'])
+            key = _status_cache_key(path)
+            with _status_cache_lock:
+                cached = _status_cache.get(path)
+            if key is None or cached is None or cached[0] == key:
+                continue
+            # Only tracking refs moving means someone fetched or pushed
+            self.scanner.rescan_repo(path, after_fetch=_same_but_tracking(cached[0], key))
+
+def fetch_repo(scanner, repo_path):
+    """Run `git fetch` in a repo and return the API response for it"""
+    try:
+        with repo_operation(repo_path):
+            result = subprocess.run(['git', 'fetch'], cwd=repo_path, 
+                                 capture_output=True, text=True, timeout=30)
+        
+        if result.returncode == 0:
+            # Get updated status, with a fresh issue count
+            github_url = origin_github_url(str(repo_path))
+            if github_url:
+                invalidate_open_issues(github_url)
+            status = scanner.rescan_repo(repo_path, after_fetch=True)
+            return {
+                'success': True,
+                'message': 'Fetch completed successfully',
+                'output': result.stdout + result.stderr,
+                'repo_status': status
+            }
+        invalidate_status(repo_path)
+        return {
+            'success': False,
+            'message': 'Fetch failed',
+            'output': result.stdout + result.stderr
+        }
+    except subprocess.TimeoutExpired:
+        return {
+            'success': False,
+            'message': 'Fetch timed out'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'message': f'Error during fetch: {str(e)}'
+        }
+
+def pull_repo(scanner, repo_path):
+    """Run `git pull` in a repo and return the API response for it"""
+    try:
+        with repo_operation(repo_path):
+            result = subprocess.run(['git', 'pull'], cwd=repo_path, 
+                                 capture_output=True, text=True, timeout=60)
+        
+        if result.returncode == 0:
+            # Get updated status; a manual pull is also when a changed
+            # remote gets picked up
+            origin_github_url.cache_clear()
+            status = scanner.rescan_repo(repo_path)
+            return {
+                'success': True,
+                'message': 'Pull completed successfully',
+                'output': result.stdout + result.stderr,
+                'repo_status': status
+            }
+        invalidate_status(repo_path)
+        return {
+            'success': False,
+            'message': 'Pull failed',
+            'output': result.stdout + result.stderr
+        }
+    except subprocess.TimeoutExpired:
+        return {
+            'success': False,
+            'message': 'Pull timed out'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'message': f'Error during pull: {str(e)}'
+        }
+
+class JobQueue:
+    """Runs slow operations on worker threads so requests can return at once"""
+    
+    def __init__(self, workers=JOB_WORKERS, keep=JOBS_KEPT):
+        self.keep = keep
+        self._queue = queue.Queue()
+        self._jobs = collections.OrderedDict()
+        # Keys with a job running, each mapped to the jobs waiting behind it
+        self._waiting = {}
+        self._lock = threading.Lock()
+        for _ in range(workers):
+            threading.Thread(target=self._work, daemon=True).start()
+    
+    def submit(self, func, *args, key=None):
+        """Queue `func(*args)` and return the new job's id
+        
+        Jobs with the same `key` run one at a time, in order, on a single
+        worker, so a backlog for one repo can't tie up the others.
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {'id': job_id, 'status': 'queued', 'result': None}
+            # Forget the oldest jobs; clients poll theirs right away
+            while len(self._jobs) > self.keep:
+                self._jobs.popitem(last=False)
+        self._queue.put((job_id, key, func, args))
+        return job_id
+    
+    def get(self, job_id):
+        """Snapshot of a job's state, or None if it's unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+    
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            key = job[1]
+            if key is not None:
+                with self._lock:
+                    if key in self._waiting:
+                        # The worker running this key's job picks it up next
+                        self._waiting[key].append(job)
+                        continue
+                    self._waiting[key] = collections.deque()
+            while job is not None:
+                job_id, _, func, args = job
+                job = None
+                try:
+                    self._set(job_id, status='running')
+                    try:
+                        result = func(*args)
+                    except Exception as e:
+                        # A failed job still finishes, and its worker lives on
+                        print(f'Job failed: {e}')
+                        result = {'success': False, 'message': f'Job failed: {e}'}
+                    self._set(job_id, status='done', result=result)
+                finally:
+                    # Whatever happened, hand the key on so its queue never stalls
+                    if key is not None:
+                        with self._lock:
+                            if self._waiting[key]:
+                                job = self._waiting[key].popleft()
+                            else:
+                                del self._waiting[key]
+    
+    def _set(self, job_id, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+DASHBOARD_CSS = '''
         body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
             margin: 0;
@@ -572,52 +1315,37 @@ class DashboardHandler(BaseHTTPRequestHandler):
                 justify-content: center;
             }
         }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🐱 Project Dashboard v2</h1>
-        <p>Interactive Git Repository Status</p>
-        <div id="last-update">Loading...</div>
-    </div>
-    
-    <div class="controls">
-        <button class="btn" onclick="refreshData()">🔄 Refresh</button>
-        <button class="btn" id="auto-refresh-btn" onclick="toggleAutoRefresh()">⏸️ Pause Auto-refresh</button>
-        <a class="btn" href="/api/repos" target="_blank">📋 JSON API</a>
-    </div>
-    
-    <div id="repos-container" class="loading">
-        Loading repositories...
-    </div>
-    
-    <!-- Confirmation Modal -->
-    <div id="confirmation-modal" class="modal">
-        <div class="modal-content">
-            <h3>⚠️ Confirm Git Pull</h3>
-            <div id="modal-details"></div>
-            <p id="modal-warning"></p>
-            <div class="modal-actions">
-                <button class="btn" onclick="closeModal()">Cancel</button>
-                <button class="btn danger" id="confirm-pull-btn">Pull Anyway</button>
-            </div>
-        </div>
-    </div>
-    
-    <script>
+'''
+
+DASHBOARD_JS = '''
         let autoRefreshInterval;
+        let eventSource;
         let autoRefreshEnabled = true;
         
-        // Auto-refresh every 60 seconds
+        // The server pushes the repo snapshot whenever it changes; browsers
+        // without EventSource fall back to polling every 60 seconds
         function startAutoRefresh() {
+            stopAutoRefresh();
+            if (window.EventSource) {
+                eventSource = new EventSource('/api/events');
+                eventSource.onmessage = (e) => showData(JSON.parse(e.data));
+                eventSource.addEventListener('delta', (e) => applyDelta(JSON.parse(e.data)));
+            } else {
+                refreshData();
+                autoRefreshInterval = setInterval(refreshData, 60000);
+            }
+        }
+        
+        function stopAutoRefresh() {
+            if (eventSource) eventSource.close();
             if (autoRefreshInterval) clearInterval(autoRefreshInterval);
-            autoRefreshInterval = setInterval(refreshData, 60000);
+            eventSource = autoRefreshInterval = null;
         }
         
         function toggleAutoRefresh() {
             const btn = document.getElementById('auto-refresh-btn');
             if (autoRefreshEnabled) {
-                clearInterval(autoRefreshInterval);
+                stopAutoRefresh();
                 btn.textContent = '▶️ Resume Auto-refresh';
                 autoRefreshEnabled = false;
             } else {
@@ -630,85 +1358,113 @@ class DashboardHandler(BaseHTTPRequestHandler):
         function refreshData() {
             fetch('/api/repos')
                 .then(response => response.json())
-                .then(data => {
-                    renderRepos(data);
-                    document.getElementById('last-update').textContent = 
-                        `Last update: ${new Date().toLocaleTimeString()}`;
-                })
+                .then(showData)
                 .catch(error => {
                     console.error('Error fetching data:', error);
                     showMessage('Error fetching repository data', 'error');
                 });
         }
         
+        function showData(data) {
+            renderRepos(data);
+            markUpdated();
+        }
+        
+        // Delta events carry only the repos that changed since the last event
+        function applyDelta(delta) {
+            delta.repos.forEach(repo => updateRepoDisplay(repo.name, repo));
+            markUpdated();
+        }
+        
+        function markUpdated() {
+            document.getElementById('last-update').textContent = 
+                `Last update: ${new Date().toLocaleTimeString()}`;
+        }
+        
+        // JSON of each repo as its card was last rendered, by name
+        let renderedRepos = new Map();
+        
         function renderRepos(data) {
             const container = document.getElementById('repos-container');
             
             if (data.error) {
+                renderedRepos.clear();
                 container.innerHTML = `<div class="error">${data.error}</div>`;
                 return;
             }
             
             if (!data.repos || data.repos.length === 0) {
+                renderedRepos.clear();
                 container.innerHTML = '<div class="error">No repositories found</div>';
                 return;
             }
             
-            const repoHtml = data.repos.map(repo => {
-                if (!repo.is_repo) {
-                    return `
-                        <div class="repo">
-                            <div class="repo-header">
-                                <h3 class="repo-name">${repo.name}</h3>
-                            </div>
-                            <div class="error">${repo.error || 'Not a git repository'}</div>
-                        </div>
-                    `;
-                }
-                
-                const badges = [];
-                if (repo.has_uncommitted) badges.push(`<span class="badge dirty">${repo.uncommitted_count} uncommitted</span>`);
-                if (repo.ahead > 0) badges.push(`<span class="badge ahead">${repo.ahead} ahead</span>`);
-                if (repo.behind > 0) badges.push(`<span class="badge behind">${repo.behind} behind</span>`);
-                if (repo.open_issues > 0) badges.push(`<span class="badge issues">${repo.open_issues} issues</span>`);
-                if (!repo.has_uncommitted && repo.ahead === 0 && repo.behind === 0) badges.push(`<span class="badge clean">Clean</span>`);
-                
-                const commitInfo = repo.last_commit ? `
-                    <div class="commit-info">
-                        <div><span class="commit-hash">${repo.last_commit.hash}</span> ${repo.last_commit.message}</div>
-                        <div style="color: #8b949e; margin-top: 5px;">by ${repo.last_commit.author} • ${repo.last_commit.time}</div>
-                    </div>
-                ` : '';
-                
-                const githubLink = repo.github_url ? `<a class="btn btn-sm" href="${repo.github_url}" target="_blank">GitHub</a>` : '';
-                
+            // Same repos in the same order: patch just the cards that changed
+            const rendered = [...renderedRepos.keys()];
+            if (data.repos.length === rendered.length && 
+                    data.repos.every((repo, i) => repo.name === rendered[i])) {
+                data.repos.forEach(repo => updateRepoDisplay(repo.name, repo));
+                return;
+            }
+            
+            renderedRepos = new Map(data.repos.map(repo => [repo.name, JSON.stringify(repo)]));
+            const repoHtml = data.repos.map(renderRepoCard).join('');
+            
+            container.innerHTML = `<div class="repos">${repoHtml}</div>`;
+        }
+        
+        function renderRepoCard(repo) {
+            if (!repo.is_repo) {
                 return `
                     <div class="repo" id="repo-${repo.name}">
                         <div class="repo-header">
                             <h3 class="repo-name">${repo.name}</h3>
-                            <div class="repo-actions">
-                                <button class="btn btn-sm primary" onclick="gitFetch('${repo.name}')" id="fetch-${repo.name}">📡 Fetch</button>
-                                <button class="btn btn-sm" onclick="gitPull('${repo.name}')" id="pull-${repo.name}">⬇️ Pull</button>
-                                ${githubLink}
-                            </div>
-                        </div>
-                        
-                        <div class="status-grid">
-                            <span class="status-label">Branch:</span>
-                            <span class="status-value">${repo.branch} ${badges.join('')}</span>
-                            
-                            <span class="status-label">Remote:</span>
-                            <span class="status-value">${repo.upstream || 'None'}</span>
                         </div>
-                        
-                        ${commitInfo}
-                        
-                        ${repo.error ? `<div class="error">${repo.error}</div>` : ''}
+                        <div class="error">${repo.error || 'Not a git repository'}</div>
                     </div>
                 `;
-            }).join('');
+            }
             
-            container.innerHTML = `<div class="repos">${repoHtml}</div>`;
+            const badges = [];
+            if (repo.has_uncommitted) badges.push(`<span class="badge dirty">${repo.uncommitted_count} uncommitted</span>`);
+            if (repo.ahead > 0) badges.push(`<span class="badge ahead">${repo.ahead} ahead</span>`);
+            if (repo.behind > 0) badges.push(`<span class="badge behind">${repo.behind} behind</span>`);
+            if (repo.open_issues > 0) badges.push(`<span class="badge issues">${repo.open_issues} issues</span>`);
+            if (!repo.has_uncommitted && repo.ahead === 0 && repo.behind === 0) badges.push(`<span class="badge clean">Clean</span>`);
+            
+            const commitInfo = repo.last_commit ? `
+                <div class="commit-info">
+                    <div><span class="commit-hash">${repo.last_commit.hash}</span> ${repo.last_commit.message}</div>
+                    <div style="color: #8b949e; margin-top: 5px;">by ${repo.last_commit.author} • ${repo.last_commit.time}</div>
+                </div>
+            ` : '';
+            
+            const githubLink = repo.github_url ? `<a class="btn btn-sm" href="${repo.github_url}" target="_blank">GitHub</a>` : '';
+            
+            return `
+                <div class="repo" id="repo-${repo.name}">
+                    <div class="repo-header">
+                        <h3 class="repo-name">${repo.name}</h3>
+                        <div class="repo-actions">
+                            <button class="btn btn-sm primary" onclick="gitFetch('${repo.name}')" id="fetch-${repo.name}">📡 Fetch</button>
+                            <button class="btn btn-sm" onclick="gitPull('${repo.name}')" id="pull-${repo.name}">⬇️ Pull</button>
+                            ${githubLink}
+                        </div>
+                    </div>
+                    
+                    <div class="status-grid">
+                        <span class="status-label">Branch:</span>
+                        <span class="status-value">${repo.branch} ${badges.join('')}</span>
+                        
+                        <span class="status-label">Remote:</span>
+                        <span class="status-value">${repo.upstream || 'None'}</span>
+                    </div>
+                    
+                    ${commitInfo}
+                    
+                    ${repo.error ? `<div class="error">${repo.error}</div>` : ''}
+                </div>
+            `;
         }
         
         function gitFetch(repoName) {
@@ -716,8 +1472,9 @@ class DashboardHandler(BaseHTTPRequestHandler):
             btn.disabled = true;
             btn.textContent = '📡 Fetching...';
             
-            fetch(`/api/repo/${repoName}/fetch`)
+            fetch(`/api/repo/${encodeURIComponent(repoName)}/fetch`)
                 .then(response => response.json())
+                .then(waitForJob)
                 .then(data => {
                     btn.disabled = false;
                     btn.textContent = '📡 Fetch';
@@ -744,7 +1501,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
             btn.disabled = true;
             btn.textContent = '⬇️ Pulling...';
             
-            fetch(`/api/repo/${repoName}/pull`, {
+            fetch(`/api/repo/${encodeURIComponent(repoName)}/pull`, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
@@ -752,6 +1509,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
                 body: JSON.stringify({confirmed: false})
             })
             .then(response => response.json())
+            .then(waitForJob)
             .then(data => {
                 btn.disabled = false;
                 btn.textContent = '⬇️ Pull';
@@ -774,6 +1532,23 @@ class DashboardHandler(BaseHTTPRequestHandler):
             });
         }
         
+        // Fetches and pulls run as server-side jobs; poll until the job is done and
+        // resolve with its result (other responses pass straight through)
+        function waitForJob(data) {
+            if (!data.job_id) return data;
+            return new Promise((resolve, reject) => {
+                const poll = () => fetch(`/api/jobs/${data.job_id}`)
+                    .then(response => response.json())
+                    .then(job => {
+                        if (job.status === 'done') resolve(job.result);
+                        else if (job.success === false) resolve(job);
+                        else setTimeout(poll, 2000);
+                    })
+                    .catch(reject);
+                setTimeout(poll, 500);
+            });
+        }
+        
         function showConfirmationModal(repoName, data) {
             const modal = document.getElementById('confirmation-modal');
             const details = document.getElementById('modal-details');
@@ -802,7 +1577,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
             btn.disabled = true;
             btn.textContent = '⬇️ Pulling...';
             
-            fetch(`/api/repo/${repoName}/pull`, {
+            fetch(`/api/repo/${encodeURIComponent(repoName)}/pull`, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
@@ -810,6 +1585,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
                 body: JSON.stringify({confirmed: true})
             })
             .then(response => response.json())
+            .then(waitForJob)
             .then(data => {
                 btn.disabled = false;
                 btn.textContent = '⬇️ Pull';
@@ -835,9 +1611,17 @@ class DashboardHandler(BaseHTTPRequestHandler):
         }
         
         function updateRepoDisplay(repoName, repoStatus) {
-            // This would update just the specific repo card
-            // For simplicity, we'll just refresh all data
-            setTimeout(refreshData, 500);
+            // Swap in just this repo's card, found directly by id, unless
+            // it already shows exactly this status
+            const json = JSON.stringify(repoStatus);
+            if (renderedRepos.get(repoName) === json) return;
+            const card = document.getElementById(`repo-${repoName}`);
+            if (card) {
+                renderedRepos.set(repoName, json);
+                card.outerHTML = renderRepoCard(repoStatus);
+            } else {
+                refreshData();
+            }
         }
         
         function showMessage(text, type) {
@@ -853,8 +1637,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
             setTimeout(() => message.remove(), 4000);
         }
         
-        // Initialize
-        refreshData();
+        // Initialize; the event stream starts with the current snapshot
         startAutoRefresh();
         
         // Close modal on escape key
@@ -866,53 +1649,407 @@ class DashboardHandler(BaseHTTPRequestHandler):
         document.getElementById('confirmation-modal').addEventListener('click', (e) => {
             if (e.target.id === 'confirmation-modal') closeModal();
         });
-    </script>
+'''
+
+DASHBOARD_HTML = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Project Status Dashboard v2</title>
+    <link rel="stylesheet" href="{css_url}">
+</head>
+<body>
+    <div class="header">
+        <h1>🐱 Project Dashboard v2</h1>
+        <p>Interactive Git Repository Status</p>
+        <div id="last-update">Loading...</div>
+    </div>
+    
+    <div class="controls">
+        <button class="btn" onclick="refreshData()">🔄 Refresh</button>
+        <button class="btn" id="auto-refresh-btn" onclick="toggleAutoRefresh()">⏸️ Pause Auto-refresh</button>
+        <a class="btn" href="/api/repos" target="_blank">📋 JSON API</a>
+    </div>
+    
+    <div id="repos-container" class="loading">
+        Loading repositories...
+    </div>
+    
+    <!-- Confirmation Modal -->
+    <div id="confirmation-modal" class="modal">
+        <div class="modal-content">
+            <h3>⚠️ Confirm Git Pull</h3>
+            <div id="modal-details"></div>
+            <p id="modal-warning"></p>
+            <div class="modal-actions">
+                <button class="btn" onclick="closeModal()">Cancel</button>
+                <button class="btn danger" id="confirm-pull-btn">Pull Anyway</button>
+            </div>
+        </div>
+    </div>
+    
+    <script src="{js_url}"></script>
 </body>
 </html>'''
+
+def _minify(source):
+    """Drop indentation, which is insignificant throughout the page and its assets"""
+    return re.sub(r'\n\s+', '\n', source).strip().encode('utf-8')
+
+# URL -> (body, gzipped body, content type) for the page's CSS and JS. Their
+# URLs carry a content hash, so browsers can cache them for good
+STATIC_ASSETS = {}
+
+def _add_static_asset(filename, source, content_type):
+    """Minify and precompress an embedded asset; returns its URL"""
+    body = _minify(source)
+    stem, _, ext = filename.rpartition('.')
+    url = f'/static/{stem}.{hashlib.sha256(body).hexdigest()[:12]}.{ext}'
+    STATIC_ASSETS[url] = (body, gzip.compress(body), content_type)
+    return url
+
+# The page itself is built and gzipped once at import
+DASHBOARD_HTML_BYTES = _minify(DASHBOARD_HTML
+                               .replace('{css_url}', _add_static_asset('dashboard.css', DASHBOARD_CSS, 'text/css'))
+                               .replace('{js_url}', _add_static_asset('dashboard.js', DASHBOARD_JS, 'application/javascript')))
+DASHBOARD_HTML_GZIP = gzip.compress(DASHBOARD_HTML_BYTES)
+# Weak, like the repos ETag: the gzip and identity bodies share it, which
+# strong validators may not do across content codings
+DASHBOARD_HTML_ETAG = f'W/"{hashlib.sha256(DASHBOARD_HTML_BYTES).hexdigest()[:16]}"'
+
+# Smaller responses aren't worth compressing
+GZIP_MIN_SIZE = 500
+
+NOT_FOUND_BODY = b'404 - Not Found'
+
+# (second, formatted) for the latest log line; swapped as one tuple, so
+# handler threads never see a half-updated pair
+_log_clock = (None, '')
+
+def log_timestamp():
+    """Local HH:MM:SS for log lines, formatted at most once a second"""
+    global _log_clock
+    now = int(time.time())
+    second, text = _log_clock
+    if second != now:
+        text = time.strftime('%H:%M:%S', time.localtime(now))
+        _log_clock = (now, text)
+    return text
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests; every response carries a
+    # Content-Length (or closes the connection) so clients know where it ends
+    protocol_version = 'HTTP/1.1'
+    timeout = CONNECTION_TIMEOUT
+    # Buffer writes so headers and body leave in one send; http.server
+    # flushes after each request (the event stream writes unbuffered)
+    wbufsize = 64 * 1024
+    
+    def __init__(self, scanner, jobs, *args, **kwargs):
+        self.scanner = scanner
+        self.jobs = jobs
+        self.git_dir = scanner.git_dir
+        super().__init__(*args, **kwargs)
+    
+    # Fixed GET paths and the methods that serve them; assets, jobs and repo
+    # operations are matched in do_GET
+    GET_ROUTES = {
+        '/': '_send_dashboard',
+        '/api/repos': '_send_repos_json',
+        '/api/events': '_send_events',
+    }
+    
+    def do_GET(self):
+        """Handle GET requests"""
+        route = self.GET_ROUTES.get(self.path)
+        if route is not None:
+            getattr(self, route)()
+            return
+        
+        repo_op = REPO_OP_RE.fullmatch(self.path)
+        if self.path in STATIC_ASSETS:
+            self._send_static(self.path)
+        elif self.path.startswith('/api/jobs/'):
+            self._send_job(self.path[len('/api/jobs/'):])
+        elif repo_op and repo_op.group(2) == 'fetch':
+            # Safe operation - can be GET
+            repo_path = self._repo_path(urllib.parse.unquote(repo_op.group(1)))
+            if repo_path is not None:
+                self._handle_fetch(repo_path)
+        else:
+            self._send_404()
+    
+    def do_POST(self):
+        """Handle POST requests"""
+        # Until the body has been read the connection can't carry another
+        # request, so responses sent before that close it
+        reusable, self.close_connection = not self.close_connection, True
+        repo_op = REPO_OP_RE.fullmatch(self.path)
+        if repo_op and repo_op.group(2) == 'pull':
+            repo_path = self._repo_path(urllib.parse.unquote(repo_op.group(1)))
+            if repo_path is None:
+                return
+            
+            # Read POST body for confirmation
+            content_length = int(self.headers.get('Content-Length', 0))
+            if content_length:
+                post_data = self.rfile.read(content_length).decode('utf-8')
+                try:
+                    data = json.loads(post_data)
+                    confirmed = data.get('confirmed', False)
+                except json.JSONDecodeError:
+                    confirmed = False
+            else:
+                confirmed = False
+            
+            self.close_connection = not reusable
+            self._handle_pull(repo_path, confirmed)
+        else:
+            self._send_404()
+    
+    def _send_dashboard(self):
+        """Send the main dashboard HTML"""
+        self._send_cacheable(DASHBOARD_HTML_BYTES, DASHBOARD_HTML_GZIP, DASHBOARD_HTML_ETAG, 'text/html')
+    
+    def _send_cacheable(self, body, body_gzip, etag, content_type):
+        """Send a body clients revalidate by ETag, or 304 if theirs is current"""
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if self._etag_matches(etag):
+            self.send_response(304)
+            # Same Vary as the 200 it stands in for, so caches keep the
+            # gzip and identity copies apart
+            self.send_header('Vary', 'Accept-Encoding')
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+        elif self._accepts_gzip():
+            self._send_body(200, body_gzip, content_type, 'gzip', headers)
+        else:
+            self._send_body(200, body, content_type, headers=headers)
+    
+    def _etag_matches(self, etag):
+        """Whether If-None-Match names `etag` (weak comparison, as RFC 9110 asks)"""
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        opaque = etag[2:] if etag.startswith('W/') else etag
+        for candidate in if_none_match.split(','):
+            candidate = candidate.strip()
+            if candidate.startswith('W/'):
+                candidate = candidate[2:]
+            if candidate in ('*', opaque):
+                return True
+        return False
+    
+    def _send_static(self, path):
+        """Send an embedded CSS/JS asset with long-lived caching"""
+        body, body_gzip, content_type = STATIC_ASSETS[path]
+        # The URL changes whenever the content does
+        headers = {'Cache-Control': 'public, max-age=31536000, immutable'}
+        if self._accepts_gzip():
+            self._send_body(200, body_gzip, content_type, 'gzip', headers)
+        else:
+            self._send_body(200, body, content_type, headers=headers)
+    
+    def _send_repos_json(self):
+        """Send repository information as JSON"""
+        self._send_cacheable(*self.scanner.snapshot_json(), 'application/json')
+    
+    def _send_events(self):
+        """Stream the repo snapshot as Server-Sent Events whenever it changes"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        # The stream has no length; it ends when the connection does
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        # Each event goes out in one write, so from here on write straight to
+        # the socket: a closed tab then can't leave an event in the buffer
+        # for http.server's flush and close to trip over again
+        self.wfile.flush()
+        self.wfile.close()
+        self.wfile = socketserver._SocketWriter(self.connection)
+        
+        version, shown = 0, None
+        try:
+            while True:
+                new_version, _ = self.scanner.wait_for_change(version, EVENTS_KEEPALIVE)
+                if new_version == version and shown is not None:
+                    self.wfile.write(b': keepalive\n\n')
+                    continue
+                version = new_version
+                data, (body, _, _) = self.scanner.serialized_snapshot()
+                repos = data['repos']
+                if (shown is None or data.get('error') 
+                        or [repo.get('name') for repo in repos] != [repo.get('name') for repo in shown]):
+                    # The full snapshot, sharing its cached serialization, on
+                    # connect and whenever repos come or go
+                    event = b'data: ' + body
+                else:
+                    # Otherwise only the repos that differ from the last event
+                    changed = [repo for repo, old in zip(repos, shown) if repo != old]
+                    if not changed:
+                        continue
+                    delta = {'scan_time': data.get('scan_time'), 'repos': changed}
+                    event = b'event: delta\ndata: ' + to_json(delta).encode('utf-8')
+                shown = repos
+                self.wfile.write(event + b'\n\n')
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            # Gone, or stalled past CONNECTION_TIMEOUT; either way it's over
+            pass
+    
+    def _repo_path(self, repo_name):
+        """Path of the named repo, or None after sending an error response
+        
+        Runs before anything else in a repo route, so junk names never get
+        as far as reading a request body or touching the filesystem.
+        """
+        repo_path = self.git_dir / repo_name
+        # Besides the name itself, check the joined path still sits directly
+        # in the git directory
+        if (not validate_repo_name(repo_name) 
+                or os.path.dirname(os.path.abspath(repo_path)) != os.path.abspath(self.git_dir)):
+            self._send_error_json(400, f"Invalid repository name: {repo_name}")
+            return None
+        if not repo_path.is_dir():
+            self._send_error_json(404, f"Repository {repo_name} not found")
+            return None
+        return repo_path
+    
+    def _handle_fetch(self, repo_path):
+        """Queue a git fetch; the client polls /api/jobs/<id> for the result"""
+        job_id = self.jobs.submit(fetch_repo, self.scanner, repo_path, key=str(repo_path))
+        response = {
+            'success': True,
+            'queued': True,
+            'job_id': job_id,
+            'message': 'Fetch queued'
+        }
+        self._send_response(202, to_json(response), 'application/json')
+    
+    def _handle_pull(self, repo_path, confirmed=False):
+        """Handle git pull operation with safety checks"""
+        try:
+            # The safety check must see the current working tree
+            invalidate_status(repo_path)
+            repo = RepoInfo(repo_path)
+            
+            # Safety check: uncommitted changes
+            if not confirmed and repo.status.get('has_uncommitted', False):
+                response = {
+                    'success': False,
+                    'need_confirmation': True,
+                    'message': f'Repository has {repo.status["uncommitted_count"]} uncommitted changes',
+                    'details': {
+                        'branch': repo.status.get('branch', 'unknown'),
+                        'uncommitted_count': repo.status.get('uncommitted_count', 0),
+                        'ahead': repo.status.get('ahead', 0),
+                        'behind': repo.status.get('behind', 0)
+                    },
+                    'warning': 'Pull may fail or create merge conflicts. Confirm to continue.'
+                }
+                self._send_response(200, to_json(response), 'application/json')
+                return
+        except Exception as e:
+            self._send_error_json(500, f'Error during pull: {str(e)}')
+            return
+        
+        # Pulls can take a while; run them on the job queue and let the
+        # client poll /api/jobs/<id> for the result
+        job_id = self.jobs.submit(pull_repo, self.scanner, repo_path, key=str(repo_path))
+        response = {
+            'success': True,
+            'queued': True,
+            'job_id': job_id,
+            'message': 'Pull queued'
+        }
+        self._send_response(202, to_json(response), 'application/json')
+    
+    def _send_job(self, job_id):
+        """Send a queued job's state, including its result once done"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            self._send_error_json(404, f"Job {job_id} not found")
+        else:
+            self._send_response(200, to_json(job), 'application/json')
+    
+    def _accepts_gzip(self):
+        """Whether the client's Accept-Encoding allows gzip"""
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = coding.partition(';')
+            if name.strip() == 'gzip':
+                return params.replace(' ', '') not in ('q=0', 'q=0.0')
+        return False
     
     def _send_response(self, status_code, content, content_type):
-        """Send HTTP response"""
+        """Send HTTP response, gzip-compressed when worthwhile"""
+        body = content.encode('utf-8')
+        if len(body) >= GZIP_MIN_SIZE and self._accepts_gzip():
+            self._send_body(status_code, gzip.compress(body), content_type, 'gzip')
+        else:
+            self._send_body(status_code, body, content_type)
+    
+    def _send_body(self, status_code, body, content_type, content_encoding=None, headers=None):
+        """Send an already encoded response body"""
         self.send_response(status_code)
         self.send_header('Content-Type', content_type)
-        self.send_header('Content-Length', len(content.encode('utf-8')))
+        if content_encoding:
+            self.send_header('Content-Encoding', content_encoding)
+        self.send_header('Vary', 'Accept-Encoding')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', len(body))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
         self.end_headers()
-        self.wfile.write(content.encode('utf-8'))
+        self.wfile.write(body)
     
     def _send_error_json(self, status_code, message):
         """Send error response as JSON"""
-        error_response = json.dumps({'success': False, 'message': message})
+        error_response = to_json({'success': False, 'message': message})
         self._send_response(status_code, error_response, 'application/json')
     
     def _send_404(self):
         """Send 404 response"""
-        self._send_response(404, '404 - Not Found', 'text/plain')
+        self._send_body(404, NOT_FOUND_BODY, 'text/plain')
     
     def log_message(self, format, *args):
         """Override to customize logging"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f'[{timestamp}] {format % args}')
+        print(f'[{log_timestamp()}] {format % args}')
 
-def create_handler(git_dir):
-    """Create handler with git directory"""
+def create_handler(scanner, jobs):
+    """Create handler bound to a repo scanner and job queue"""
     def handler(*args, **kwargs):
-        return DashboardHandler(git_dir, *args, **kwargs)
+        return DashboardHandler(scanner, jobs, *args, **kwargs)
     return handler
 
 def main():
     parser = argparse.ArgumentParser(description='Project Status Dashboard v2')
     parser.add_argument('--port', type=int, default=8766, help='Port to run on (default: 8766)')
-    parser.add_argument('--git-dir', default=os.path.expanduser('~/git'), 
+    parser.add_argument('--git-dir', default=str(GIT_ROOT), 
                        help='Directory containing git repositories')
+    parser.add_argument('--fetch-interval', type=int, default=FETCH_INTERVAL, 
+                       help=f'Seconds between background fetches, 0 to disable (default: {FETCH_INTERVAL})')
     
     args = parser.parse_args()
     
-    git_dir = Path(args.git_dir).expanduser().resolve()
-    if not git_dir.exists():
+    # abspath is plain string work; resolve() would lstat every component
+    git_dir = Path(os.path.abspath(os.path.expanduser(args.git_dir)))
+    if not git_dir.is_dir():
         print(f"Error: Git directory {git_dir} does not exist")
         sys.exit(1)
     
-    handler = create_handler(git_dir)
-    server = HTTPServer(('', args.port), handler)
+    fetch_concurrency = env_int('DASHBOARD_FETCH_CONCURRENCY', FETCH_CONCURRENCY, minimum=1)
+    set_fetch_concurrency(fetch_concurrency)
+    
+    scanner = RepoScanner(git_dir)
+    scanner.start()
+    if args.fetch_interval > 0:
+        RepoFetcher(scanner, args.fetch_interval).start()
+    RepoWatcher(scanner).start()
+    handler = create_handler(scanner, JobQueue(workers=fetch_concurrency))
+    server = ThreadingHTTPServer(('', args.port), handler)
     
     print(f"""
 🐱 Project Status Dashboard v2 starting...
@@ -4,8 +4,10 @@ Quick test script for Project Status Dashboard v2
 Validates core functionality without starting the server.
 """
 
+import os
 import sys
 import subprocess
+import tempfile
 from pathlib import Path
 
 def test_imports():
@@ -52,7 +54,9 @@ def test_git_commands():
 
 def test_git_repos_directory():
     """Check if ~/git directory exists and has repos."""
-    git_dir = Path.home() / "git"
+    sys.path.insert(0, str(Path(__file__).parent))
+    from dashboard import GIT_ROOT
+    git_dir = GIT_ROOT
     
     if not git_dir.exists():
         print(f"❌ {git_dir} does not exist")
@@ -74,16 +78,143 @@ def test_dashboard_class():
     """Test that the dashboard handler class can be instantiated."""
     try:
         sys.path.insert(0, str(Path(__file__).parent))
-        from dashboard import ProjectDashboardHandler
+        from dashboard import DashboardHandler
         
         # Create a mock instance (without actual HTTP handling)
-        handler_class = ProjectDashboardHandler
-        print("✅ ProjectDashboardHandler class loads successfully")
+        handler_class = DashboardHandler
+        print("✅ DashboardHandler class loads successfully")
         return True
     except Exception as e:
         print(f"❌ Failed to load dashboard class: {e}")
         return False
 
+def test_porcelain_parser():
+    """Test parsing of batched `git status --porcelain=v2 --branch` output."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from dashboard import parse_porcelain_v2
+    
+    output = (
+        b"# branch.oid 6b9de26d52df97d236b372b0c83048bf46b9d54e\n"
+        b"# branch.head main\n"
+        b"# branch.upstream origin/main\n"
+        b"# branch.ab +2 -1\n"
+        b"1 .M N... 100644 100644 100644 7898192 7898192 src/my file.py\n"
+        b"2 R. N... 100644 100644 100644 7898192 7898192 R100 new.txt\told.txt\n"
+        b"? untracked.txt\n"
+    )
+    info = parse_porcelain_v2(output)
+    expected = {
+        'branch': 'main',
+        'upstream': 'origin/main',
+        'ahead': 2,
+        'behind': 1,
+        'uncommitted_count': 3,
+        'has_uncommitted': True,
+        'uncommitted_files': [' M src/my file.py', 'R  new.txt', '?? untracked.txt'],
+    }
+    if info != expected:
+        print(f"❌ Unexpected parse result: {info}")
+        return False
+    
+    info = parse_porcelain_v2(b"# branch.oid (initial)\n# branch.head main\n")
+    if info['upstream'] is not None or info['has_uncommitted']:
+        print(f"❌ Unexpected parse result for fresh repo: {info}")
+        return False
+    
+    many = b"# branch.head main\n" + b"".join(b"? file%d\n" % i for i in range(40))
+    info = parse_porcelain_v2(many)
+    if info['uncommitted_count'] != 40 or len(info['uncommitted_files']) != 5:
+        print(f"❌ Unexpected count/preview for dirty repo: {info}")
+        return False
+    
+    print("✅ Porcelain v2 status parses correctly")
+    return True
+
+def test_relative_time():
+    """Test relative commit time formatting."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from dashboard import relative_time
+    
+    now = 1_700_000_000
+    cases = [
+        (now, "0 seconds ago"),
+        (now - 1, "1 second ago"),
+        (now - 150, "2 minutes ago"),
+        (now - 3 * 3600, "3 hours ago"),
+        (now - 8 * 86400, "1 week ago"),
+        (now - 400 * 86400, "1 year ago"),
+    ]
+    for timestamp, expected in cases:
+        actual = relative_time(timestamp, now)
+        if actual != expected:
+            print(f"❌ relative_time({now - timestamp}s) = {actual!r}, expected {expected!r}")
+            return False
+    
+    print("✅ Relative commit times format correctly")
+    return True
+
+def test_loose_commit():
+    """Test reading the last commit straight from a loose object."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from dashboard import read_loose_commit
+    
+    env = dict(os.environ, GIT_AUTHOR_NAME='Zoë Author', GIT_AUTHOR_EMAIL='zoe@example.com',
+               GIT_AUTHOR_DATE='1600000000 +0200', GIT_COMMITTER_NAME='Other Committer',
+               GIT_COMMITTER_EMAIL='other@example.com', GIT_COMMITTER_DATE='1700000000 -0500')
+    with tempfile.TemporaryDirectory() as repo:
+        subprocess.run(['git', 'init', '-q', repo], check=True, env=env)
+        subprocess.run(['git', '-C', repo, 'commit', '-q', '--allow-empty',
+                        '-m', 'Subject that\nwraps a line', '-m', 'Body text'], check=True, env=env)
+        expected = subprocess.run(['git', '-C', repo, 'log', '-1', '--format=%H%x1f%s%x1f%an%x1f%at'],
+                                  capture_output=True, text=True, check=True).stdout.strip().split('\x1f')
+        commit = read_loose_commit(Path(repo) / '.git', expected[0])
+    
+    if commit is None:
+        print("❌ Loose commit object could not be read")
+        return False
+    actual = [commit['hash'], commit['message'], commit['author'], str(commit['timestamp'])]
+    if actual != [expected[0][:8]] + expected[1:]:
+        print(f"❌ Loose commit read as {actual}, git log says {expected}")
+        return False
+    
+    print("✅ Loose commit objects read like git log")
+    return True
+
+def test_repo_names():
+    """Test that repo names from URLs can't escape the git directory."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from dashboard import DashboardHandler, validate_repo_name
+    
+    valid = ['has space', 'café', 'a+b']
+    invalid = ['..', '.', '.hidden', 'a/b', 'a\0b', '']
+    for name in valid + invalid:
+        if validate_repo_name(name) != (name in valid):
+            print(f"❌ validate_repo_name({name!r}) = {validate_repo_name(name)}")
+            return False
+    
+    with tempfile.TemporaryDirectory() as git_dir:
+        for name in valid + ['.hidden']:
+            (Path(git_dir) / name).mkdir()
+        # Just enough of a handler for _repo_path, recording error statuses
+        handler = DashboardHandler.__new__(DashboardHandler)
+        handler.git_dir = Path(git_dir)
+        errors = []
+        handler._send_error_json = lambda code, message: errors.append(code)
+        for name in valid:
+            if handler._repo_path(name) != Path(git_dir) / name:
+                print(f"❌ _repo_path rejected {name!r}")
+                return False
+        for name in invalid:
+            if handler._repo_path(name) is not None or errors[-1] != 400:
+                print(f"❌ _repo_path accepted {name!r}")
+                return False
+        if handler._repo_path('missing') is not None or errors[-1] != 404:
+            print("❌ _repo_path accepted a missing repo")
+            return False
+    
+    print("✅ Repo names are validated")
+    return True
+
 def main():
     """Run all tests."""
     print("🧪 Testing Project Status Dashboard v2\n")
@@ -93,6 +224,10 @@ def main():
         ("Git commands", test_git_commands),
         ("Git repositories directory", test_git_repos_directory),
         ("Dashboard handler class", test_dashboard_class),
+        ("Porcelain status parser", test_porcelain_parser),
+        ("Relative commit times", test_relative_time),
+        ("Loose commit reader", test_loose_commit),
+        ("Repo name validation", test_repo_names),
     ]
     
     passed = 0